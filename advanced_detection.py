@@ -7,177 +7,494 @@ and specialized detection for specific issue patterns.
 """
 
 import networkx as nx
-from typing import Dict, List, Set, Tuple, Any
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations, islice
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+# pandas is optional: when present, shadowing detection groups node IDs
+# with vectorized string ops instead of a per-node Python loop.
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# numba is optional: when present, the per-cycle instance-span check runs
+# as a compiled integer loop instead of Python set operations. numba
+# cannot work with strings, so nodes and instances are int-encoded first.
+try:
+    import numpy as np
+    from numba import njit
+
+    @njit(cache=True)
+    def _spans_multiple_instances(cycle_ids, instance_ids):
+        first = instance_ids[cycle_ids[0]]
+        for i in range(1, cycle_ids.shape[0]):
+            if instance_ids[cycle_ids[i]] != first:
+                return True
+        return False
+except ImportError:
+    np = None
+    _spans_multiple_instances = None
+
+# Graphs at or above this size amortize the process start-up and
+# serialization cost of running the detections in parallel.
+PARALLEL_NODE_THRESHOLD = 500
+
+# Long dependency chains grow exponentially with graph density; reports
+# rarely need more than a sample, so detect_all_issues caps them here.
+DEFAULT_CHAIN_LIMIT = 100
+
+
+def _run_detection(method_name: str, kwargs: dict, nodes: list, edges: list) -> Any:
+    """
+    Worker entry point: rebuild the graph and run one detection.
+
+    The graph is shipped to the worker as (node, attrs) and (u, v, attrs)
+    lists, which pickle faster than a full DiGraph.
+    """
+    graph = nx.DiGraph()
+    graph.add_nodes_from(nodes)
+    graph.add_edges_from(edges)
+    # Generators cannot cross the process boundary; materialize here.
+    return list(getattr(AdvancedDetection, method_name)(graph, **kwargs))
 
 class AdvancedDetection:
     """Advanced detection algorithms for JFrog repositories."""
-    
+
+    # Memoized detect_all_issues results keyed by graph signature, so
+    # re-running the same analysis (e.g. toggling report views) is O(1).
+    _result_cache: Dict[int, Dict[str, Any]] = {}
+    _result_cache_max = 8
+
+    @staticmethod
+    def _graph_signature(graph: nx.DiGraph) -> int:
+        """
+        Hash the graph's node and edge sets into a cache key.
+
+        Node and edge counts are included so the frozenset hash cannot
+        collide across graphs that merely share an edge subset.
+        """
+        return hash((
+            graph.number_of_nodes(),
+            graph.number_of_edges(),
+            frozenset(graph.nodes()),
+            frozenset(graph.edges()),
+        ))
+
     @staticmethod
-    def find_include_cycles(graph: nx.DiGraph) -> List[List[str]]:
+    def _split_node_ids(graph: nx.DiGraph) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Split every "instance:repo_key" node ID once, up front.
+
+        Returns (instance_of, repokey_of) dicts keyed by node ID, so hot
+        loops over cycles and pairs avoid re-splitting the same immutable
+        strings. str.partition does a single C-level scan and returns a
+        tuple directly, with no list allocation.
+        """
+        instance_of = {}
+        repokey_of = {}
+        for node in graph.nodes():
+            instance, _, repo_key = node.partition(':')
+            instance_of[node] = instance
+            repokey_of[node] = repo_key
+        return instance_of, repokey_of
+
+    @staticmethod
+    def _typed_subgraph(graph: nx.DiGraph, edge_type: str) -> nx.DiGraph:
+        """
+        Build the subgraph of edges carrying the given edge_type.
+
+        edge_subgraph returns a filtered view without per-edge Python
+        bookkeeping; .copy() materializes it once so the detection
+        algorithms work on an independent graph.
+        """
+        edges = [(u, v) for u, v, data in graph.edges(data=True)
+                 if data.get('edge_type') == edge_type]
+        return graph.edge_subgraph(edges).copy()
+
+    @staticmethod
+    def _nontrivial_sccs(graph: nx.DiGraph):
+        """
+        Yield strongly connected components that can contain a cycle.
+
+        Simple cycles never cross SCC boundaries, so running the cycle search
+        per-component avoids re-exploring the rest of the graph. Singleton
+        components are skipped unless the node has a self-loop.
+        """
+        for scc in nx.strongly_connected_components(graph):
+            if len(scc) > 1:
+                yield scc
+            else:
+                node = next(iter(scc))
+                if graph.has_edge(node, node):
+                    yield scc
+
+    @staticmethod
+    def find_include_cycles(graph: nx.DiGraph) -> Iterator[List[str]]:
         """Find cycles involving only 'includes' relationships between virtual repositories."""
-        include_graph = nx.DiGraph()
-        
-        # Create a subgraph with only 'includes' edges
-        for u, v, data in graph.edges(data=True):
-            if data.get('edge_type') == 'includes':
-                include_graph.add_edge(u, v)
-        
-        # Find cycles in the include-only graph
-        include_cycles = list(nx.simple_cycles(include_graph))
-        return include_cycles
+        include_graph = AdvancedDetection._typed_subgraph(graph, 'includes')
+
+        # Find cycles per strongly connected component instead of over the
+        # whole graph - simple_cycles is exponential in the worst case, so
+        # restricting it to components that can actually hold a cycle is a
+        # large win on sparse or disconnected graphs.
+        for scc in AdvancedDetection._nontrivial_sccs(include_graph):
+            yield from nx.simple_cycles(include_graph.subgraph(scc))
     
     @staticmethod
-    def find_remote_chains(graph: nx.DiGraph) -> List[List[str]]:
+    def has_cycle(graph: nx.DiGraph) -> bool:
+        """
+        Check whether the graph contains any cycle, without enumerating them.
+
+        nx.find_cycle stops at the first cycle found (linear time), unlike
+        nx.simple_cycles which enumerates every cycle.
+        """
+        try:
+            nx.find_cycle(graph, orientation='original')
+            return True
+        except nx.NetworkXNoCycle:
+            return False
+
+    @staticmethod
+    def has_include_cycle(graph: nx.DiGraph) -> bool:
+        """Check whether any cycle exists among 'includes' relationships."""
+        include_graph = AdvancedDetection._typed_subgraph(graph, 'includes')
+        return AdvancedDetection.has_cycle(include_graph)
+
+    @staticmethod
+    def find_remote_chains(graph: nx.DiGraph) -> Iterator[List[str]]:
         """Find chains of remote repositories that point to each other."""
-        remote_graph = nx.DiGraph()
-        
-        # Create a subgraph with only 'remote' edges
-        for u, v, data in graph.edges(data=True):
-            if data.get('edge_type') == 'remote':
-                remote_graph.add_edge(u, v)
-        
-        # Find all paths of length > 1 that could form a chain
-        remote_chains = []
+        remote_graph = AdvancedDetection._typed_subgraph(graph, 'remote')
+
+        # A remote repository points at a single upstream, so the remote
+        # subgraph is essentially functional: each chain can be recovered by
+        # walking successors from its start node. This replaces the old
+        # all-pairs all_simple_paths enumeration with one O(V+E) walk.
         for node in remote_graph.nodes():
-            if remote_graph.out_degree(node) > 0:
-                # Find all simple paths from this node to any other node
-                for target in remote_graph.nodes():
-                    if node != target:
-                        for path in nx.all_simple_paths(remote_graph, node, target, cutoff=10):
-                            if len(path) > 1:
-                                remote_chains.append(path)
-        
-        return remote_chains
+            if remote_graph.in_degree(node) != 0:
+                continue  # Not a chain start
+
+            path = [node]
+            visited = dict.fromkeys(path)
+            current = next(iter(remote_graph.successors(node)), None)
+            while current is not None and current not in visited:
+                path.append(current)
+                visited[current] = None
+                current = next(iter(remote_graph.successors(current)), None)
+
+            if len(path) > 1:
+                yield path
+
+        # Chains that live entirely inside a remote cycle have no
+        # zero-indegree start node; emit each such cycle once.
+        for scc in AdvancedDetection._nontrivial_sccs(remote_graph):
+            start = next(iter(scc))
+            cycle = [start]
+            current = next(iter(remote_graph.successors(start)), None)
+            while current is not None and current != start:
+                cycle.append(current)
+                current = next(iter(remote_graph.successors(current)), None)
+            if len(cycle) > 1:
+                yield cycle
         
     @staticmethod
-    def find_complex_dependency_paths(graph: nx.DiGraph) -> List[List[str]]:
+    def find_complex_dependency_paths(graph: nx.DiGraph) -> Iterator[List[str]]:
         """
         Find paths that involve complex dependencies between virtual and remote repositories.
         This specifically looks for patterns like:
         virtual repo -> includes -> remote repo -> points to -> another virtual repo
         """
-        # Create a subgraph with relevant edges
-        complex_graph = nx.DiGraph()
-        
-        # First, add all edges that are part of complex dependencies
-        for u, v, data in graph.edges(data=True):
-            if data.get('edge_type') == 'complex_dependency':
-                complex_graph.add_edge(u, v)
-                
+        # Create a subgraph with only the complex-dependency edges
+        complex_graph = AdvancedDetection._typed_subgraph(graph, 'complex_dependency')
+
+
         # Find longer paths through this graph that might form a complex dependency chain
-        complex_paths = []
         for node in complex_graph.nodes():
             if complex_graph.out_degree(node) > 0:
                 for target in complex_graph.nodes():
                     if node != target:
                         for path in nx.all_simple_paths(complex_graph, node, target, cutoff=5):
                             if len(path) > 1:
-                                # If this path forms a cycle in the original graph, add it
+                                # If this path forms a cycle in the original graph, yield it
                                 if nx.has_path(graph, path[-1], path[0]):
-                                    full_path = path + [path[0]]  # Complete the cycle
-                                    complex_paths.append(full_path)
+                                    yield path + [path[0]]  # Complete the cycle
                                 else:
-                                    complex_paths.append(path)
-        
-        return complex_paths
+                                    yield path
     
     @staticmethod
-    def find_cross_instance_loops(graph: nx.DiGraph) -> List[List[str]]:
+    def find_cross_instance_loops(graph: nx.DiGraph,
+                                  instance_of: Optional[Dict[str, str]] = None) -> Iterator[List[str]]:
         """Find loops that span multiple Artifactory instances."""
-        cross_instance_loops = []
-        
-        # Get all cycles
-        all_cycles = list(nx.simple_cycles(graph))
-        
-        # Check each cycle to see if it spans multiple instances
-        for cycle in all_cycles:
-            instances = set()
-            for node in cycle:
-                instance = node.split(':')[0]  # Extract instance name from node ID
-                instances.add(instance)
-            
-            # If cycle spans multiple instances, add it to the result
-            if len(instances) > 1:
-                cross_instance_loops.append(cycle)
-        
-        return cross_instance_loops
+        if instance_of is None:
+            instance_of, _ = AdvancedDetection._split_node_ids(graph)
+
+        # With numba available, int-encode nodes and instances once so the
+        # per-cycle span check is a compiled loop over int32 arrays rather
+        # than a Python set build per cycle.
+        if _spans_multiple_instances is not None:
+            node_id = {node: i for i, node in enumerate(graph.nodes())}
+            instance_codes = {}
+            instance_ids = np.empty(len(node_id), dtype=np.int32)
+            for node, i in node_id.items():
+                instance_ids[i] = instance_codes.setdefault(
+                    instance_of[node], len(instance_codes))
+
+            def spans_multiple(cycle):
+                cycle_ids = np.fromiter(
+                    (node_id[node] for node in cycle), np.int32, len(cycle))
+                return _spans_multiple_instances(cycle_ids, instance_ids)
+        else:
+            def spans_multiple(cycle):
+                return len({instance_of[node] for node in cycle}) > 1
+
+        # Enumerate cycles per strongly connected component and filter each
+        # cycle as it is produced, so the full cycle list is never
+        # materialized in memory.
+        for scc in AdvancedDetection._nontrivial_sccs(graph):
+            for cycle in nx.simple_cycles(graph.subgraph(scc)):
+                # Yield only cycles spanning multiple instances
+                if spans_multiple(cycle):
+                    yield cycle
     
     @staticmethod
-    def detect_repository_shadowing(graph: nx.DiGraph) -> List[Tuple[str, str]]:
+    def detect_repository_shadowing(graph: nx.DiGraph,
+                                    instance_of: Optional[Dict[str, str]] = None,
+                                    repokey_of: Optional[Dict[str, str]] = None) -> Iterator[Tuple[str, str]]:
         """
         Detect cases where multiple repositories with the same name exist across instances,
         which could lead to confusion or unintended behavior.
         """
-        shadowed_repos = []
+        groups = AdvancedDetection.detect_shadowing_groups(graph, instance_of, repokey_of)
+
+        # combinations is implemented in C and avoids the quadratic
+        # Python-level index loop for names shared by many instances.
+        for nodes in groups.values():
+            yield from combinations(nodes, 2)
+
+    @staticmethod
+    def detect_shadowing_groups(graph: nx.DiGraph,
+                                instance_of: Optional[Dict[str, str]] = None,
+                                repokey_of: Optional[Dict[str, str]] = None) -> Dict[str, List[str]]:
+        """
+        Group shadowed repositories by name.
+
+        Returns a dict mapping each repository key that exists on more than
+        one instance to the list of node IDs carrying that key. This is the
+        compact form; detect_repository_shadowing expands it into pairs.
+        """
+        if instance_of is None or repokey_of is None:
+            # Without precomputed split maps, prefer the vectorized pandas
+            # path: splitting and grouping tens of thousands of node IDs
+            # runs in C instead of a Python loop per node.
+            if pd is not None:
+                return AdvancedDetection._shadowing_groups_vectorized(graph)
+            instance_of, repokey_of = AdvancedDetection._split_node_ids(graph)
+
         repo_map = {}  # Maps repository names to their full node IDs
-        
+
         # Group repositories by their key name
         for node in graph.nodes():
-            repo_key = node.split(':')[-1]  # Extract repo name from node ID
+            repo_key = repokey_of[node]
             if repo_key not in repo_map:
                 repo_map[repo_key] = []
             repo_map[repo_key].append(node)
-        
-        # Find repos with the same name across different instances
-        for repo_key, nodes in repo_map.items():
-            if len(nodes) > 1:
-                # Check if they're on different instances
-                instances = set(node.split(':')[0] for node in nodes)
-                if len(instances) > 1:
-                    # Add all pairs of shadowed repos
-                    for i in range(len(nodes)):
-                        for j in range(i+1, len(nodes)):
-                            shadowed_repos.append((nodes[i], nodes[j]))
-        
-        return shadowed_repos
+
+        # Keep only names that appear on more than one instance
+        return {
+            repo_key: nodes
+            for repo_key, nodes in repo_map.items()
+            if len(nodes) > 1 and len({instance_of[node] for node in nodes}) > 1
+        }
+
+    @staticmethod
+    def _shadowing_groups_vectorized(graph: nx.DiGraph) -> Dict[str, List[str]]:
+        """Group shadowed repositories using vectorized pandas string ops."""
+        nodes = pd.Series(list(graph.nodes()), dtype=object)
+        if nodes.empty:
+            return {}
+
+        parts = nodes.str.split(':', n=1, expand=True)
+        df = pd.DataFrame({'node': nodes, 'instance': parts[0], 'repo': parts[1]})
+
+        groups = {}
+        for repo_key, group in df.groupby('repo', sort=False):
+            if len(group) > 1 and group['instance'].nunique() > 1:
+                groups[repo_key] = group['node'].tolist()
+        return groups
     
     @staticmethod
-    def detect_long_dependency_chains(graph: nx.DiGraph, max_length: int = 5) -> List[List[str]]:
+    def detect_long_dependency_chains(graph: nx.DiGraph, max_length: int = 5,
+                                      limit: Optional[int] = None) -> Iterator[List[str]]:
         """
         Detect long dependency chains that might cause performance issues.
         A long chain is defined as a path where repositories depend on each other in sequence.
+
+        Args:
+            graph: The repository graph to analyze
+            max_length: Chains longer than this many repositories are reported
+            limit: Stop after this many chains (None for no cap); path counts
+                grow exponentially with density, so reports usually only need
+                a sample
         """
-        long_chains = []
-        
-        # Find all simple paths of length greater than max_length
+        chains = AdvancedDetection._iter_long_chains(graph, max_length)
+        return islice(chains, limit) if limit is not None else chains
+
+    @staticmethod
+    def has_long_chain(graph: nx.DiGraph, max_length: int = 5) -> bool:
+        """Check whether any dependency chain longer than max_length exists."""
+        return next(AdvancedDetection._iter_long_chains(graph, max_length), None) is not None
+
+    @staticmethod
+    def _iter_long_chains(graph: nx.DiGraph, max_length: int) -> Iterator[List[str]]:
+        """Yield every dependency chain longer than max_length."""
+        # One iterative DFS per source instead of all_simple_paths for every
+        # (source, target) pair, which redid the same traversal V times and
+        # materialized every path. A path is reported as soon as it exceeds
+        # max_length and is not extended further, bounding the search depth.
         for source in graph.nodes():
-            for target in graph.nodes():
-                if source != target:
-                    for path in nx.all_simple_paths(graph, source, target, cutoff=max_length+1):
-                        if len(path) > max_length:
-                            long_chains.append(path)
-        
-        return long_chains
+            path = [source]
+            # Plain dict rather than a set/OrderedDict: dict preserves
+            # insertion order and its insert/pop are cheaper than
+            # OrderedDict's linked-list bookkeeping in this hot loop.
+            visited = dict.fromkeys(path)
+            stack = [iter(graph.successors(source))]
+
+            while stack:
+                child = next(stack[-1], None)
+                if child is None:
+                    stack.pop()
+                    visited.pop(path.pop(), None)
+                elif child not in visited:
+                    path.append(child)
+                    if len(path) > max_length:
+                        yield list(path)
+                        path.pop()
+                    else:
+                        visited[child] = None
+                        stack.append(iter(graph.successors(child)))
     
     @staticmethod
-    def detect_isolated_repositories(graph: nx.DiGraph) -> List[str]:
+    def detect_isolated_repositories(graph: nx.DiGraph) -> Iterator[str]:
         """
         Detect repositories that are not included in any virtual repository
         and are not used as a remote source, i.e., they are isolated.
         """
-        isolated = []
-        
         for node in graph.nodes():
             # Check if this node has any incoming edges
             if graph.in_degree(node) == 0:
                 node_data = graph.nodes[node]
                 # Only consider local repositories as potentially isolated
                 if node_data.get('repo_type') == 'local':
-                    isolated.append(node)
-        
-        return isolated
+                    yield node
     
     @staticmethod
-    def detect_all_issues(graph: nx.DiGraph) -> Dict[str, Any]:
-        """Run all detection algorithms and return a comprehensive report."""
-        results = {
-            'include_cycles': AdvancedDetection.find_include_cycles(graph),
-            'remote_chains': AdvancedDetection.find_remote_chains(graph),
-            'complex_dependency_paths': AdvancedDetection.find_complex_dependency_paths(graph),
-            'cross_instance_loops': AdvancedDetection.find_cross_instance_loops(graph),
-            'shadowed_repositories': AdvancedDetection.detect_repository_shadowing(graph),
-            'long_dependency_chains': AdvancedDetection.detect_long_dependency_chains(graph),
-            'isolated_repositories': AdvancedDetection.detect_isolated_repositories(graph)
+    def detect_all_issues(graph: nx.DiGraph, parallel: Optional[bool] = None,
+                          materialize: bool = True) -> Dict[str, Any]:
+        """
+        Run all detection algorithms and return a comprehensive report.
+
+        Args:
+            graph: The repository graph to analyze
+            parallel: Run the independent detections in a process pool.
+                Defaults to auto: parallel for graphs of at least
+                PARALLEL_NODE_THRESHOLD nodes, sequential otherwise
+                (worker start-up costs more than it saves on small graphs).
+            materialize: With True (the default) every result value is a
+                list. With False the values are lazy generators, so callers
+                can stream results (or just count them) with bounded memory;
+                this forces sequential execution since generators cannot
+                cross process boundaries.
+        """
+        # Re-running the analysis on an unchanged graph is common in the
+        # report/UI flow; serve materialized results from the cache. Lazy
+        # results are never cached since their generators are single-use.
+        if materialize:
+            signature = AdvancedDetection._graph_signature(graph)
+            cached = AdvancedDetection._result_cache.get(signature)
+            if cached is not None:
+                return dict(cached)
+
+        # Relabel nodes to contiguous integers for the duration of the
+        # analysis: NetworkX adjacency lookups then hash small ints instead
+        # of long "instance:repo" strings, and cycles/paths carry ints
+        # until they are translated back just before returning.
+        graph_int = nx.convert_node_labels_to_integers(graph, label_attribute='orig')
+        reverse = {i: data['orig'] for i, data in graph_int.nodes(data=True)}
+
+        # Split every original node ID once, keyed by the int label, so
+        # the per-cycle and per-pair loops never call str.split.
+        instance_of = {}
+        repokey_of = {}
+        for i, orig in reverse.items():
+            instance, _, repo_key = orig.partition(':')
+            instance_of[i] = instance
+            repokey_of[i] = repo_key
+
+        # Cheap linear-time existence checks first: only pay for full cycle
+        # enumeration when a cycle is known to exist (graphs are usually
+        # acyclic in practice).
+        has_any_cycle = AdvancedDetection.has_cycle(graph_int)
+
+        # The detections are independent, so each result key maps to the
+        # method (plus kwargs) that produces it and can be dispatched to a
+        # worker.
+        tasks = {
+            'remote_chains': ('find_remote_chains', {}),
+            'complex_dependency_paths': ('find_complex_dependency_paths', {}),
+            'shadowed_repositories': ('detect_repository_shadowing',
+                                      {'instance_of': instance_of,
+                                       'repokey_of': repokey_of}),
+            'long_dependency_chains': ('detect_long_dependency_chains',
+                                       {'limit': DEFAULT_CHAIN_LIMIT}),
+            'isolated_repositories': ('detect_isolated_repositories', {}),
         }
-        
+        if AdvancedDetection.has_include_cycle(graph_int):
+            tasks['include_cycles'] = ('find_include_cycles', {})
+        if has_any_cycle:
+            tasks['cross_instance_loops'] = ('find_cross_instance_loops',
+                                             {'instance_of': instance_of})
+
+        def translate(item):
+            """Map an int-labelled result item back to original node IDs."""
+            if isinstance(item, list):
+                return [reverse[node] for node in item]
+            if isinstance(item, tuple):
+                return tuple(reverse[node] for node in item)
+            return reverse[item]
+
+        results = {'include_cycles': [], 'cross_instance_loops': []}
+
+        if not materialize:
+            parallel = False
+        elif parallel is None:
+            parallel = graph_int.number_of_nodes() >= PARALLEL_NODE_THRESHOLD
+
+        if parallel:
+            # Serialize the graph once as node/edge lists and let each
+            # worker rebuild it; wall-clock becomes roughly the slowest
+            # detection instead of the sum of all of them.
+            nodes = list(graph_int.nodes(data=True))
+            edges = list(graph_int.edges(data=True))
+            with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = {
+                    key: executor.submit(_run_detection, method_name, kwargs, nodes, edges)
+                    for key, (method_name, kwargs) in tasks.items()
+                }
+                for key, future in futures.items():
+                    results[key] = [translate(item) for item in future.result()]
+        else:
+            for key, (method_name, kwargs) in tasks.items():
+                method = getattr(AdvancedDetection, method_name)
+                result = method(graph_int, **kwargs)
+                if materialize:
+                    results[key] = [translate(item) for item in result]
+                else:
+                    results[key] = map(translate, result)
+
+        if materialize:
+            cache = AdvancedDetection._result_cache
+            while len(cache) >= AdvancedDetection._result_cache_max:
+                cache.pop(next(iter(cache)))
+            cache[signature] = dict(results)
+
         return results
\ No newline at end of file
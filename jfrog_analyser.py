@@ -7,20 +7,62 @@ across multiple Artifactory instances.
 """
 
 import argparse
+import asyncio
 import json
 import logging
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Set, Tuple, Optional, Any
 
 import yaml
 import requests
 import networkx as nx
+
+# LibYAML's C loader parses ~10x faster than the pure-Python one and has
+# identical safe-loading semantics; fall back when PyYAML was built
+# without it.
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
+
 from rich.console import Console
 from rich.table import Table
 from rich.logging import RichHandler
 from dotenv import load_dotenv
-import matplotlib.pyplot as plt
+
+from csr_graph import build_csr, nontrivial_components, tarjan_scc
+
+# aiohttp is optional: when present, all instances and their per-repo
+# detail requests are fetched on one event loop instead of thread pools.
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Cap on in-flight detail requests per instance in the async fetch path.
+ASYNC_FETCH_LIMIT = 64
+
+# Above this node count the spring layout (O(V^2) per iteration) takes
+# far longer than the analysis itself, so visualization is skipped.
+VISUALIZE_NODE_LIMIT = 500
+
+# orjson parses the large nested repository payloads several times faster
+# than the stdlib and takes raw bytes directly; fall back to json if
+# unavailable.
+try:
+    import orjson
+
+    def _loads(data) -> Any:
+        return orjson.loads(data)
+except ImportError:
+    def _loads(data) -> Any:
+        return json.loads(data)
 
 # Configure logging
 logging.basicConfig(
@@ -34,74 +76,195 @@ logger = logging.getLogger("jfrog-analyser")
 # Rich console for pretty output
 console = Console()
 
+def build_session(pool_size: int = 32) -> requests.Session:
+    """
+    Create a pooled requests session for Artifactory API calls.
+
+    Keep-alive avoids a TLS handshake per request, the retry policy
+    rides out transient gateway errors, and asking for gzip shrinks the
+    large repository JSON payloads on the wire (requests inflates them
+    transparently). pool_maxsize is per host, so one session can be
+    shared across instances without them contending for connections.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({'Accept-Encoding': 'gzip'})
+    return session
+
 class ArtifactoryInstance:
     """Represents a JFrog Artifactory instance."""
     
-    def __init__(self, name: str, url: str, api_key: str = None, username: str = None, password: str = None):
+    # Concurrent per-repo detail fetches per instance; matches the size of
+    # the session's connection pool.
+    MAX_FETCH_WORKERS = 32
+
+    def __init__(self, name: str, url: str, api_key: str = None, username: str = None,
+                 password: str = None, session: Optional[requests.Session] = None):
         self.name = name
         self.url = url.rstrip('/')
         self.api_key = api_key
         self.username = username
         self.password = password
         self.repositories = {}
-        
+
+        # Use the session shared by the analyser when given (connection
+        # pools are per host, so instances do not contend); build a
+        # private one so the class still works standalone. Auth headers
+        # are computed once up front.
+        self.session = session if session is not None else build_session(self.MAX_FETCH_WORKERS)
+
+        # Credentials are fixed for the lifetime of the instance, so
+        # resolve them once instead of re-encoding per request: API keys
+        # become a header, username/password an HTTPBasicAuth object.
+        self._auth = None
+        if api_key:
+            self._cached_headers = {"X-JFrog-Art-Api": api_key}
+        elif username and password:
+            self._auth = HTTPBasicAuth(username, password)
+            self._cached_headers = {}
+        else:
+            self._cached_headers = {}
+
     def __str__(self) -> str:
         return f"{self.name} ({self.url})"
-    
-    def get_auth_headers(self) -> Dict[str, str]:
-        """Get authentication headers for API requests."""
-        if self.api_key:
-            return {"X-JFrog-Art-Api": self.api_key}
-        elif self.username and self.password:
-            return {"Authorization": f"Basic {self.get_basic_auth()}"}
-        return {}
-    
-    def get_basic_auth(self) -> str:
-        """Generate Basic auth string."""
-        import base64
-        auth_str = f"{self.username}:{self.password}"
-        return base64.b64encode(auth_str.encode()).decode()
-    
-    def fetch_repositories(self) -> Dict[str, Dict[str, Any]]:
-        """Fetch all repositories from this Artifactory instance."""
+
+    def _fetch_detail(self, repo: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch detailed info for one repository, falling back to the basic entry."""
+        repo_key = repo['key']
+        repo_detail_url = f"{self.url}/api/repositories/{repo_key}"
+        try:
+            detail_response = self.session.get(
+                repo_detail_url, headers=self._cached_headers, auth=self._auth, timeout=10)
+            if detail_response.status_code == 200:
+                return _loads(detail_response.content)
+        except requests.RequestException:
+            pass
+        logger.warning(f"Failed to fetch details for repository {repo_key}")
+        return repo
+
+    def fetch_repositories(self, force_full_detail: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch all repositories from this Artifactory instance.
+
+        The repository list payload already carries key, type, url and
+        packageType - everything graph building needs for local and
+        remote repos - so the per-repo detail call is only made for
+        virtual repos, whose 'repositories' include list is absent from
+        the listing. Pass force_full_detail=True to fetch full details
+        for every repository regardless.
+        """
         try:
-            headers = self.get_auth_headers()
             repos_url = f"{self.url}/api/repositories"
-            
-            response = requests.get(repos_url, headers=headers)
+
+            response = self.session.get(repos_url, headers=self._cached_headers,
+                                        auth=self._auth, timeout=10)
             response.raise_for_status()
-            
+
             # Get basic repository information
-            repos_list = response.json()
-            
-            # Fetch detailed info for each repository
+            repos_list = _loads(response.content)
             for repo in repos_list:
-                repo_key = repo['key']
-                repo_detail_url = f"{self.url}/api/repositories/{repo_key}"
-                detail_response = requests.get(repo_detail_url, headers=headers)
-                
-                if detail_response.status_code == 200:
-                    self.repositories[repo_key] = detail_response.json()
-                else:
-                    logger.warning(f"Failed to fetch details for repository {repo_key}")
-                    self.repositories[repo_key] = repo
-            
+                self.repositories[repo['key']] = repo
+
+            if force_full_detail:
+                detail_targets = repos_list
+            else:
+                detail_targets = [repo for repo in repos_list
+                                  if repo.get('type', '').lower() == 'virtual']
+
+            # Fan the per-repo detail fetches out over threads: they are
+            # pure network I/O, so wall time drops from N round-trips to
+            # roughly N / MAX_FETCH_WORKERS.
+            if detail_targets:
+                with ThreadPoolExecutor(max_workers=self.MAX_FETCH_WORKERS) as executor:
+                    for repo, details in zip(detail_targets,
+                                             executor.map(self._fetch_detail, detail_targets)):
+                        self.repositories[repo['key']] = details
+
             logger.info(f"Fetched {len(self.repositories)} repositories from {self.name}")
             return self.repositories
-        
+
         except requests.RequestException as e:
             logger.error(f"Failed to fetch repositories from {self.name}: {e}")
             return {}
 
+    async def _afetch_repositories(self, session,
+                                   force_full_detail: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Async variant of fetch_repositories sharing one aiohttp session."""
+        semaphore = asyncio.Semaphore(ASYNC_FETCH_LIMIT)
+        aio_auth = (aiohttp.BasicAuth(self.username, self.password)
+                    if self._auth is not None else None)
+
+        async def fetch_detail(repo):
+            repo_key = repo['key']
+            url = f"{self.url}/api/repositories/{repo_key}"
+            try:
+                async with semaphore:
+                    async with session.get(url, headers=self._cached_headers,
+                                           auth=aio_auth) as resp:
+                        if resp.status == 200:
+                            return await resp.json(loads=_loads)
+            except aiohttp.ClientError:
+                pass
+            logger.warning(f"Failed to fetch details for repository {repo_key}")
+            return repo
+
+        try:
+            repos_url = f"{self.url}/api/repositories"
+            async with session.get(repos_url, headers=self._cached_headers,
+                                   auth=aio_auth) as resp:
+                resp.raise_for_status()
+                repos_list = await resp.json(loads=_loads)
+
+            for repo in repos_list:
+                self.repositories[repo['key']] = repo
+
+            # As in the sync path, only virtual repos need the detail
+            # round-trip for their include list.
+            if force_full_detail:
+                detail_targets = repos_list
+            else:
+                detail_targets = [repo for repo in repos_list
+                                  if repo.get('type', '').lower() == 'virtual']
+
+            details = await asyncio.gather(*[fetch_detail(repo) for repo in detail_targets])
+            for repo, detail in zip(detail_targets, details):
+                self.repositories[repo['key']] = detail
+
+            logger.info(f"Fetched {len(self.repositories)} repositories from {self.name}")
+            return self.repositories
+
+        except aiohttp.ClientError as e:
+            logger.error(f"Failed to fetch repositories from {self.name}: {e}")
+            return {}
+
 
 class JFrogAnalyser:
     """Main class for analyzing JFrog Artifactory configurations."""
     
     def __init__(self, config_path: str):
         self.config_path = config_path
+        # One session serves every instance: per-host pooling means they
+        # share nothing but the object, and credentials stay per-request.
+        self._session = build_session(ArtifactoryInstance.MAX_FETCH_WORKERS)
         self.instances: List[ArtifactoryInstance] = []
         self.repository_graph = nx.DiGraph()
         self.detected_loops = []
+        # Node IDs grouped by repo_type, populated by
+        # build_repository_graph so later passes can visit just the
+        # types they care about.
+        self._nodes_by_type: Dict[str, List[int]] = {}
+        # Graph nodes are dense integer IDs; these side tables map
+        # (instance, repo) to its ID and an ID back to its names, so the
+        # hot paths hash ints while reports still print real names.
+        self._id_of: Dict[Tuple[str, str], int] = {}
+        self._name_of: List[str] = []
+        self._key_of: List[str] = []
         
         # Load configuration
         self.load_config()
@@ -110,7 +273,7 @@ class JFrogAnalyser:
         """Load configuration from YAML file."""
         try:
             with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=YamlSafeLoader)
             
             # Process Artifactory instances
             for instance in config.get('artifactory_instances', []):
@@ -129,7 +292,8 @@ class JFrogAnalyser:
                     continue
                 
                 self.instances.append(
-                    ArtifactoryInstance(name, url, api_key, username, password)
+                    ArtifactoryInstance(name, url, api_key, username, password,
+                                        session=self._session)
                 )
             
             logger.info(f"Loaded {len(self.instances)} Artifactory instances from config")
@@ -140,72 +304,125 @@ class JFrogAnalyser:
     
     def fetch_all_repositories(self):
         """Fetch repositories from all configured Artifactory instances."""
-        for instance in self.instances:
-            instance.fetch_repositories()
+        if not self.instances:
+            return
+        if aiohttp is not None:
+            # One event loop handles every instance and every detail
+            # request with negligible per-task overhead.
+            asyncio.run(self._afetch_all())
+            return
+        # Instances are independent, so fetch them concurrently as well;
+        # each instance then fans out its own detail requests.
+        with ThreadPoolExecutor(max_workers=len(self.instances)) as executor:
+            list(executor.map(lambda instance: instance.fetch_repositories(),
+                              self.instances))
+
+    async def _afetch_all(self):
+        """Fetch every instance's repositories over one aiohttp session."""
+        connector = aiohttp.TCPConnector(limit=128, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            await asyncio.gather(
+                *[instance._afetch_repositories(session) for instance in self.instances]
+            )
     
     def build_repository_graph(self):
         """Build a directed graph of repository relationships."""
+        # Local alias: the graph is touched on nearly every line below,
+        # and attribute lookup on self adds up inside the hot loops.
+        G = self.repository_graph
+
         # Clear existing graph
-        self.repository_graph.clear()
-        
-        # Add nodes for all repositories
+        G.clear()
+
+        # Nodes are dense integers allocated in discovery order: edge
+        # and attribute lookups then hash small ints instead of
+        # freshly-built "instance:repo" strings, and the side tables
+        # below translate IDs back to names only where output needs
+        # them. id_of doubles as the existence check for edge targets.
+        id_of: Dict[Tuple[str, str], int] = {}
+        name_of: List[str] = []
+        key_of: List[str] = []
+        nodes = []
         for instance in self.instances:
             for repo_key, repo_data in instance.repositories.items():
-                node_id = f"{instance.name}:{repo_key}"
-                self.repository_graph.add_node(
-                    node_id,
-                    instance=instance.name,
-                    repo_key=repo_key,
-                    repo_type=repo_data.get('type', 'unknown'),
-                    package_type=repo_data.get('packageType', 'unknown')
-                )
-        
-        # First pass: Add all direct relationships (includes and remotes)
+                nid = len(name_of)
+                id_of[(instance.name, repo_key)] = nid
+                name_of.append(instance.name)
+                key_of.append(repo_key)
+                nodes.append((nid, {
+                    'instance': instance.name,
+                    'repo_key': repo_key,
+                    'repo_type': repo_data.get('type', 'unknown'),
+                    'package_type': repo_data.get('packageType', 'unknown')
+                }))
+        G.add_nodes_from(nodes)
+        self._id_of = id_of
+        self._name_of = name_of
+        self._key_of = key_of
+
+        # Compile every known instance base URL into one regex
+        # alternation: each remote URL is then classified by a single
+        # C-level match instead of one startswith per instance. Longest
+        # URLs first so the most specific base wins.
+        url_to_instance = {instance.url: instance for instance in self.instances}
+        url_pattern = re.compile(
+            '^(' + '|'.join(sorted(map(re.escape, url_to_instance),
+                                   key=len, reverse=True)) + ')(/.*)?$'
+        )
+
+        # First pass: collect all direct relationships (includes and
+        # remotes) and add them in one batched call. Nodes are bucketed
+        # by type on the way through, so later passes (e.g. the
+        # remote-to-virtual check) can visit just the types they need.
+        edges = []
+        nodes_by_type: Dict[str, List[int]] = {}
         for instance in self.instances:
             for repo_key, repo_data in instance.repositories.items():
-                source_node = f"{instance.name}:{repo_key}"
-                
+                source_node = id_of[(instance.name, repo_key)]
+                repo_type = repo_data.get('type')
+                nodes_by_type.setdefault(repo_type or 'unknown', []).append(source_node)
+
                 # For remote repositories, check URL to see if it points to another Artifactory
-                if repo_data.get('type') == 'remote':
+                if repo_type == 'remote':
                     remote_url = repo_data.get('url', '')
-                    
+
                     # Check if this remote URL points to one of our known instances
-                    for target_instance in self.instances:
-                        if remote_url.startswith(target_instance.url):
-                            # Extract the repository key from the remote URL
-                            # The format is usually: https://artifactory-url/artifactory/repo-key
-                            url_path = remote_url[len(target_instance.url):].strip('/')
-                            if url_path.startswith('api/'):
-                                continue  # Skip API endpoints
-                                
-                            # Handle various URL formats
-                            parts = url_path.split('/')
-                            if len(parts) >= 1:
-                                target_repo = parts[-1]  # Last part should be repo name
-                                
-                                # Verify this repository exists in the target instance
-                                if target_repo in target_instance.repositories:
-                                    target_node = f"{target_instance.name}:{target_repo}"
-                                    self.repository_graph.add_edge(
-                                        source_node, 
-                                        target_node,
-                                        edge_type='remote'
-                                    )
-                                    logger.debug(f"Added remote edge: {source_node} -> {target_node}")
-                
+                    match = url_pattern.match(remote_url)
+                    if match:
+                        target_instance = url_to_instance[match.group(1)]
+                        # Extract the repository key from the remote URL
+                        # The format is usually: https://artifactory-url/artifactory/repo-key
+                        url_path = (match.group(2) or '').strip('/')
+                        if url_path.startswith('api/'):
+                            continue  # Skip API endpoints
+
+                        # Handle various URL formats
+                        parts = url_path.split('/')
+                        if len(parts) >= 1:
+                            target_repo = parts[-1]  # Last part should be repo name
+
+                            # Verify this repository exists in the target instance
+                            target_node = id_of.get((target_instance.name, target_repo))
+                            if target_node is not None:
+                                edges.append((source_node, target_node,
+                                              {'edge_type': 'remote'}))
+                                logger.debug(f"Added remote edge: {instance.name}:{repo_key} "
+                                             f"-> {target_instance.name}:{target_repo}")
+
                 # For virtual repositories, check includes
-                if repo_data.get('type') == 'virtual':
+                elif repo_type == 'virtual':
                     # Virtual repositories can include other repositories from the same instance
                     for included_repo in repo_data.get('repositories', []):
-                        if included_repo in instance.repositories:
-                            target_node = f"{instance.name}:{included_repo}"
-                            self.repository_graph.add_edge(
-                                source_node,
-                                target_node,
-                                edge_type='includes'
-                            )
-                            logger.debug(f"Added include edge: {source_node} -> {target_node}")
-        
+                        target_node = id_of.get((instance.name, included_repo))
+                        if target_node is not None:
+                            edges.append((source_node, target_node,
+                                          {'edge_type': 'includes'}))
+                            logger.debug(f"Added include edge: {instance.name}:{repo_key} "
+                                         f"-> {instance.name}:{included_repo}")
+
+        G.add_edges_from(edges)
+        self._nodes_by_type = nodes_by_type
+
         # Second pass: Handle complex dependencies between virtual and remote repos
         # This handles the case of: virtual repo -> includes -> remote repo -> points to -> another virtual repo
         def traverse_complex_paths(start_node, current_node, visited=None):
@@ -224,28 +441,28 @@ class JFrogAnalyser:
                 return
                 
             visited.add(current_node)
-            
+
             # Get the node's repo type
-            current_type = self.repository_graph.nodes[current_node].get('repo_type')
-            
+            current_type = G.nodes[current_node].get('repo_type')
+
             # For all successors of the current node
-            for successor in list(self.repository_graph.successors(current_node)):
-                successor_type = self.repository_graph.nodes[successor].get('repo_type')
-                edge_data = self.repository_graph.get_edge_data(current_node, successor)
+            for successor in list(G.successors(current_node)):
+                successor_type = G.nodes[successor].get('repo_type')
+                edge_data = G.get_edge_data(current_node, successor)
                 edge_type = edge_data.get('edge_type') if edge_data else None
-                
+
                 # Case 1: If current is virtual and successor is remote
                 if current_type == 'virtual' and successor_type == 'remote' and edge_type == 'includes':
                     # Look at where the remote points to
-                    for remote_target in list(self.repository_graph.successors(successor)):
-                        remote_target_type = self.repository_graph.nodes[remote_target].get('repo_type')
-                        remote_edge_data = self.repository_graph.get_edge_data(successor, remote_target)
+                    for remote_target in list(G.successors(successor)):
+                        remote_target_type = G.nodes[remote_target].get('repo_type')
+                        remote_edge_data = G.get_edge_data(successor, remote_target)
                         remote_edge_type = remote_edge_data.get('edge_type') if remote_edge_data else None
-                        
+
                         # If remote points to a virtual repo, add a direct edge
                         if remote_target_type == 'virtual' and remote_edge_type == 'remote':
                             # Add a direct edge from the original virtual repo to the target virtual repo
-                            self.repository_graph.add_edge(
+                            G.add_edge(
                                 start_node,
                                 remote_target,
                                 edge_type='complex_dependency'
@@ -259,16 +476,51 @@ class JFrogAnalyser:
                 traverse_complex_paths(start_node, successor, visited)
         
         # Find all virtual repositories and start traversal from each
-        for node, data in self.repository_graph.nodes(data=True):
+        for node, data in G.nodes(data=True):
             if data.get('repo_type') == 'virtual':
                 traverse_complex_paths(node, node)
-        
-        logger.info(f"Built repository graph with {self.repository_graph.number_of_nodes()} nodes and {self.repository_graph.number_of_edges()} edges")
+
+        logger.info(f"Built repository graph with {G.number_of_nodes()} nodes and {G.number_of_edges()} edges")
     
-    def detect_loops(self):
-        """Detect loops in the repository graph."""
-        self.detected_loops = list(nx.simple_cycles(self.repository_graph))
-        
+    def detect_loops(self, max_cycle_length: Optional[int] = None):
+        """
+        Detect loops in the repository graph.
+
+        Simple cycles never cross strongly-connected-component boundaries,
+        so the graph is first flattened to an int32 CSR adjacency and
+        decomposed with the iterative Tarjan in csr_graph - cheap,
+        cache-friendly integer work instead of dict traversal. Cycle
+        enumeration then runs only inside nontrivial SCCs, with node
+        names rehydrated just for those.
+
+        Args:
+            max_cycle_length: Cap enumerated cycle length, bounding the
+                otherwise unbounded enumeration inside large SCCs
+        """
+        graph = self.repository_graph
+        self.detected_loops = []
+
+        if graph.number_of_nodes() == 0:
+            logger.info("No repository loops detected.")
+            return []
+
+        # Most real topologies are acyclic; one linear-time DAG check
+        # lets those skip the CSR build and SCC pass entirely.
+        if nx.is_directed_acyclic_graph(graph):
+            logger.info("No repository loops detected.")
+            return []
+
+        indptr, indices, nodes = build_csr(graph)
+        comp_id, comp_sizes = tarjan_scc(indptr, indices)
+
+        for group in nontrivial_components(indptr, indices, comp_id, comp_sizes):
+            subgraph = graph.subgraph(nodes[i] for i in group)
+            if max_cycle_length is not None:
+                cycles = nx.simple_cycles(subgraph, length_bound=max_cycle_length)
+            else:
+                cycles = nx.simple_cycles(subgraph)
+            self.detected_loops.extend(cycles)
+
         if self.detected_loops:
             logger.warning(f"Detected {len(self.detected_loops)} repository loops!")
             return self.detected_loops
@@ -279,17 +531,35 @@ class JFrogAnalyser:
     def detect_remote_to_virtual_issues(self):
         """Detect remote repositories pointing to virtual repositories."""
         issues = []
-        
-        for node, node_data in self.repository_graph.nodes(data=True):
-            if node_data.get('repo_type') == 'remote':
-                for successor in self.repository_graph.successors(node):
-                    successor_data = self.repository_graph.nodes[successor]
-                    if successor_data.get('repo_type') == 'virtual':
-                        issues.append((node, successor))
-                        logger.warning(f"Remote repository {node} points to virtual repository {successor}")
-        
+        graph = self.repository_graph
+
+        # Only remote nodes can be sources of this issue, so walk the
+        # bucket built by build_repository_graph instead of every node;
+        # recompute it if the graph was populated some other way.
+        remote_nodes = self._nodes_by_type.get('remote')
+        if remote_nodes is None:
+            remote_nodes = [node for node, data in graph.nodes(data=True)
+                            if data.get('repo_type') == 'remote']
+
+        for node in remote_nodes:
+            for successor in graph.successors(node):
+                successor_data = graph.nodes[successor]
+                if successor_data.get('repo_type') == 'virtual':
+                    issues.append((node, successor))
+                    logger.warning(f"Remote repository {self._node_label(node)} points to "
+                                   f"virtual repository {self._node_label(successor)}")
+
         return issues
-    
+
+    def _node_label(self, node) -> str:
+        """Format a node as instance:repo via the side tables."""
+        try:
+            return f"{self._name_of[node]}:{self._key_of[node]}"
+        except (TypeError, IndexError):
+            # Graph populated without build_repository_graph; the node
+            # is its own best label.
+            return str(node)
+
     def generate_report(self):
         """Generate a report of detected issues."""
         console.rule("[bold red]JFrog Artifactory Analysis Report")
@@ -303,7 +573,8 @@ class JFrogAnalyser:
             table.add_column("Loop Type", style="purple")
             
             for i, loop in enumerate(self.detected_loops, 1):
-                path = " → ".join(loop + [loop[0]])  # Add first node again to show complete loop
+                # Add first node again to show complete loop
+                path = " → ".join(self._node_label(node) for node in loop + [loop[0]])
                 
                 # Get repository types for each node in the loop
                 repo_types = []
@@ -342,12 +613,9 @@ class JFrogAnalyser:
             table.add_column("Recommendation", style="green")
             
             for remote, virtual in remote_virtual_issues:
-                remote_parts = remote.split(":")
-                virtual_parts = virtual.split(":")
-                
-                remote_name = f"{remote_parts[0]}/{remote_parts[1]}"
-                virtual_name = f"{virtual_parts[0]}/{virtual_parts[1]}"
-                
+                remote_name = f"{self._name_of[remote]}/{self._key_of[remote]}"
+                virtual_name = f"{self._name_of[virtual]}/{self._key_of[virtual]}"
+
                 recommendation = f"Point to a specific local or remote repository instead of the virtual repository"
                 
                 table.add_row(remote_name, virtual_name, recommendation)
@@ -366,12 +634,9 @@ class JFrogAnalyser:
             table.add_column("Dependency Path", style="yellow")
             
             for source, target in complex_dependencies:
-                source_parts = source.split(":")
-                target_parts = target.split(":")
-                
-                source_name = f"{source_parts[0]}/{source_parts[1]}"
-                target_name = f"{target_parts[0]}/{target_parts[1]}"
-                
+                source_name = f"{self._name_of[source]}/{self._key_of[source]}"
+                target_name = f"{self._name_of[target]}/{self._key_of[target]}"
+
                 # Try to find a path to explain this relationship
                 dependency_path = "Virtual repo includes remote repo pointing to virtual repo"
                 
@@ -381,23 +646,41 @@ class JFrogAnalyser:
     
     def visualize_graph(self, output_file: str = 'repository_graph.png'):
         """Visualize the repository graph."""
+        num_nodes = self.repository_graph.number_of_nodes()
+        if num_nodes > VISUALIZE_NODE_LIMIT:
+            logger.warning(
+                f"Skipping visualization: graph has {num_nodes} nodes "
+                f"(limit {VISUALIZE_NODE_LIMIT})")
+            return
+
+        # matplotlib costs hundreds of milliseconds to import, so pull it
+        # in only when a figure is actually rendered; the Agg backend
+        # writes PNGs without needing a display.
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+
         try:
             plt.figure(figsize=(12, 10))
             
             # Create position layout
             pos = nx.spring_layout(self.repository_graph, seed=42)
             
-            # Draw nodes with different colors based on type
-            repo_types = nx.get_node_attributes(self.repository_graph, 'repo_type')
-            
-            local_repos = [node for node, data in self.repository_graph.nodes(data=True) 
-                         if data.get('repo_type') == 'local']
-            remote_repos = [node for node, data in self.repository_graph.nodes(data=True) 
-                          if data.get('repo_type') == 'remote']
-            virtual_repos = [node for node, data in self.repository_graph.nodes(data=True) 
-                           if data.get('repo_type') == 'virtual']
-            other_repos = [node for node, data in self.repository_graph.nodes(data=True) 
-                         if data.get('repo_type') not in ['local', 'remote', 'virtual']]
+            # Bucket nodes by type and collect display labels in a single
+            # pass over the node set instead of one full scan per bucket.
+            node_buckets = {'local': [], 'remote': [], 'virtual': [], 'other': []}
+            labels = {}
+            for node, data in self.repository_graph.nodes(data=True):
+                repo_type = data.get('repo_type')
+                bucket = repo_type if repo_type in ('local', 'remote', 'virtual') else 'other'
+                node_buckets[bucket].append(node)
+                # Just show repo name, not instance
+                labels[node] = data.get('repo_key', node)
+
+            local_repos = node_buckets['local']
+            remote_repos = node_buckets['remote']
+            virtual_repos = node_buckets['virtual']
+            other_repos = node_buckets['other']
             
             # Draw nodes
             nx.draw_networkx_nodes(self.repository_graph, pos, nodelist=local_repos, 
@@ -409,17 +692,19 @@ class JFrogAnalyser:
             nx.draw_networkx_nodes(self.repository_graph, pos, nodelist=other_repos, 
                                   node_color='gray', node_size=500, alpha=0.8, label='Other')
             
-            # Draw edges with different styles based on type
-            edge_types = nx.get_edge_attributes(self.repository_graph, 'edge_type')
-            
-            remote_edges = [(u, v) for u, v, data in self.repository_graph.edges(data=True) 
-                           if data.get('edge_type') == 'remote']
-            include_edges = [(u, v) for u, v, data in self.repository_graph.edges(data=True) 
-                            if data.get('edge_type') == 'includes']
-            complex_edges = [(u, v) for u, v, data in self.repository_graph.edges(data=True) 
-                            if data.get('edge_type') == 'complex_dependency']
-            other_edges = [(u, v) for u, v, data in self.repository_graph.edges(data=True) 
-                          if data.get('edge_type') not in ['remote', 'includes', 'complex_dependency']]
+            # Bucket edges by type in one pass as well, instead of one
+            # full edge scan per style.
+            edge_buckets = {'remote': [], 'includes': [], 'complex_dependency': [], 'other': []}
+            for u, v, data in self.repository_graph.edges(data=True):
+                edge_type = data.get('edge_type')
+                bucket = (edge_type if edge_type in ('remote', 'includes', 'complex_dependency')
+                          else 'other')
+                edge_buckets[bucket].append((u, v))
+
+            remote_edges = edge_buckets['remote']
+            include_edges = edge_buckets['includes']
+            complex_edges = edge_buckets['complex_dependency']
+            other_edges = edge_buckets['other']
             
             # Draw edges
             nx.draw_networkx_edges(self.repository_graph, pos, edgelist=remote_edges, 
@@ -436,10 +721,6 @@ class JFrogAnalyser:
                                   connectionstyle='arc3,rad=0.1', label='Other')
             
             # Draw labels with shortened names
-            labels = {}
-            for node in self.repository_graph.nodes():
-                labels[node] = node.split(':')[-1]  # Just show repo name, not instance
-            
             nx.draw_networkx_labels(self.repository_graph, pos, labels, font_size=8)
             
             plt.title('JFrog Artifactory Repository Relationships')
@@ -457,7 +738,7 @@ class JFrogAnalyser:
         except Exception as e:
             logger.error(f"Failed to visualize graph: {e}")
     
-    def analyze(self):
+    def analyze(self, visualize: bool = True):
         """Run the full analysis workflow."""
         console.print("[bold blue]Starting JFrog Artifactory Analysis...[/bold blue]")
         
@@ -477,8 +758,9 @@ class JFrogAnalyser:
         self.generate_report()
         
         # Visualize graph
-        with console.status("[bold green]Visualizing repository relationships..."):
-            self.visualize_graph()
+        if visualize:
+            with console.status("[bold green]Visualizing repository relationships..."):
+                self.visualize_graph()
         
         console.print("[bold blue]Analysis complete![/bold blue]")
 
@@ -493,7 +775,9 @@ def main():
                         help='Path to configuration file')
     parser.add_argument('--verbose', '-v', action='store_true',
                         help='Enable verbose logging')
-    
+    parser.add_argument('--no-visualize', action='store_true',
+                        help='Skip rendering the repository graph visualization')
+
     args = parser.parse_args()
     
     # Set log level
@@ -502,7 +786,7 @@ def main():
     
     # Run analysis
     analyser = JFrogAnalyser(args.config)
-    analyser.analyze()
+    analyser.analyze(visualize=not args.no_visualize)
 
 
 if __name__ == '__main__':
@@ -3,33 +3,121 @@
 Utility functions for JFrog Artifactory Analyzer.
 """
 
+import copy
 import os
 import json
 import yaml
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional
 from rich.console import Console
 
+# LibYAML's C loader parses ~10x faster than the pure-Python one and has
+# identical safe-loading semantics; fall back when PyYAML was built
+# without it.
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
+# orjson parses JSON configs several times faster than the stdlib; fall
+# back to json if unavailable.
+try:
+    import orjson
+
+    def _load_json(f) -> Dict[str, Any]:
+        return orjson.loads(f.read())
+except ImportError:
+    _load_json = json.load
+
+# fastjsonschema compiles a schema to a specialized validator function
+# at import time, so the common valid-config case is checked in one
+# native-speed pass; fall back to the hand-written checks without it.
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 console = Console()
 
-def load_config_file(file_path: str) -> Dict[str, Any]:
-    """Load configuration from YAML or JSON file."""
-    if not os.path.exists(file_path):
+# Mirrors the checks in _collect_config_errors: instances need a name,
+# a url and either an api_key or a username/password pair.
+_CONFIG_SCHEMA = {
+    'type': 'object',
+    'required': ['artifactory_instances'],
+    'properties': {
+        'artifactory_instances': {
+            'type': 'array',
+            'items': {
+                'type': 'object',
+                'required': ['name', 'url'],
+                'anyOf': [
+                    {'required': ['api_key']},
+                    {'required': ['username', 'password']},
+                ],
+            },
+        },
+    },
+}
+
+_validate_schema = (fastjsonschema.compile(_CONFIG_SCHEMA)
+                    if fastjsonschema is not None else None)
+
+def _load_yaml(f) -> Dict[str, Any]:
+    """Parse a YAML stream with the fastest available safe loader."""
+    return yaml.load(f, Loader=YamlSafeLoader)
+
+# Parser lookup by file extension, resolved once at import time.
+_LOADERS = {
+    '.yaml': _load_yaml,
+    '.yml': _load_yaml,
+    '.json': _load_json,
+}
+
+# Parsed-config cache keyed by absolute path; entries are
+# (mtime_ns, size, parsed) and stay valid while the file is unchanged.
+# LRU-bounded so repeated loads of many configs cannot grow unbounded.
+_CONFIG_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+_CONFIG_CACHE_MAX = 100
+
+def load_config_file(file_path: str, mutate: bool = True) -> Dict[str, Any]:
+    """
+    Load configuration from YAML or JSON file.
+
+    Repeat loads of an unchanged file (same mtime and size) are served
+    from an in-memory cache instead of re-parsing. The cached tree is
+    deep-copied before returning so callers can mutate it freely; pass
+    mutate=False to skip the copy when the result is treated read-only.
+    """
+    path = os.path.abspath(file_path)
+    if not os.path.exists(path):
         console.print(f"[bold red]Error:[/bold red] Config file not found: {file_path}")
         raise FileNotFoundError(f"Config file not found: {file_path}")
-    
+
+    stat = os.stat(path)
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        _CONFIG_CACHE.move_to_end(path)
+        return copy.deepcopy(cached[2]) if mutate else cached[2]
+
+    loader = _LOADERS.get(os.path.splitext(path)[1])
+    if loader is None:
+        console.print(f"[bold red]Error:[/bold red] Unsupported config file format: {file_path}")
+        raise ValueError(f"Unsupported config file format: {file_path}")
+
     try:
-        with open(file_path, 'r') as f:
-            if file_path.endswith('.yaml') or file_path.endswith('.yml'):
-                return yaml.safe_load(f)
-            elif file_path.endswith('.json'):
-                return json.load(f)
-            else:
-                console.print(f"[bold red]Error:[/bold red] Unsupported config file format: {file_path}")
-                raise ValueError(f"Unsupported config file format: {file_path}")
+        with open(path, 'r') as f:
+            parsed = loader(f)
     except (yaml.YAMLError, json.JSONDecodeError) as e:
         console.print(f"[bold red]Error:[/bold red] Failed to parse config file: {e}")
         raise
 
+    _CONFIG_CACHE[path] = (stat.st_mtime_ns, stat.st_size, parsed)
+    _CONFIG_CACHE.move_to_end(path)
+    if len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX:
+        _CONFIG_CACHE.popitem(last=False)
+
+    return copy.deepcopy(parsed) if mutate else parsed
+
 def save_results_to_file(results: Dict[str, Any], file_path: str) -> None:
     """Save analysis results to JSON file."""
     try:
@@ -45,29 +133,49 @@ def format_repository_path(instance_name: str, repo_key: str) -> str:
     return f"{instance_name}/{repo_key}"
 
 def extract_repo_from_url(url: str, base_url: str) -> Optional[str]:
-    """Extract repository key from a remote repository URL."""
+    """
+    Extract repository key from a remote repository URL.
+
+    Uses str.partition so the common patterns are resolved in a single
+    C-level scan, with no intermediate list of path segments.
+    """
     if not url.startswith(base_url):
         return None
-    
-    path = url[len(base_url):].strip('/')
-    parts = path.split('/')
-    
-    # Handle various URL patterns
+
+    rest = url[len(base_url):]
+
     # Example: https://artifactory.example.com/artifactory/repo-key
-    if 'artifactory' in parts:
-        artifactory_index = parts.index('artifactory')
-        if len(parts) > artifactory_index + 1:
-            return parts[artifactory_index + 1]
+    head, sep, tail = rest.partition('/artifactory/')
+    if sep:
+        return tail.split('/', 1)[0] or None
+
+    # An 'artifactory' marker with no repo segment after it
+    trimmed = rest.strip('/')
+    if trimmed == 'artifactory' or trimmed.endswith('/artifactory'):
+        return None
+
     # Example: https://artifactory.example.com/repo-key
-    elif len(parts) > 0:
-        return parts[0]
-    
-    return None
+    return trimmed.split('/', 1)[0] or None
 
 def validate_config(config: Dict[str, Any]) -> List[str]:
     """Validate the configuration file and return a list of errors, if any."""
+    if _validate_schema is not None:
+        try:
+            _validate_schema(config)
+            return []
+        except fastjsonschema.JsonSchemaException as e:
+            # fastjsonschema stops at the first violation; rerun the
+            # detailed checks so every problem is reported with the
+            # usual messages, keeping the schema's own message as a
+            # fallback for anything they do not cover.
+            errors = _collect_config_errors(config)
+            return errors if errors else ['.'.join(map(str, e.path)) + ': ' + e.message]
+    return _collect_config_errors(config)
+
+def _collect_config_errors(config: Dict[str, Any]) -> List[str]:
+    """Walk the config and collect every validation error message."""
     errors = []
-    
+
     # Check if artifactory_instances exists and is a list
     if 'artifactory_instances' not in config:
         errors.append("Missing 'artifactory_instances' section in config")
@@ -105,18 +213,21 @@ def get_edge_label(edge_type: str) -> str:
     return labels.get(edge_type, edge_type)
 
 def redact_credentials(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Create a copy of the config with sensitive information redacted."""
-    import copy
-    
-    # Deep copy to avoid modifying the original
-    redacted_config = copy.deepcopy(config)
-    
-    # Redact sensitive information
+    """
+    Create a copy of the config with sensitive information redacted.
+
+    Only the top-level mapping, the instance list and the instance dicts
+    themselves are copied - the fields being overwritten all live there,
+    so a full deepcopy of the config tree would be pure overhead.
+    """
+    redacted_config = {**config}
+
     if 'artifactory_instances' in redacted_config:
-        for instance in redacted_config['artifactory_instances']:
-            if 'api_key' in instance:
-                instance['api_key'] = '********'
-            if 'password' in instance:
-                instance['password'] = '********'
-    
+        redacted_config['artifactory_instances'] = [
+            {**instance,
+             **({'api_key': '********'} if 'api_key' in instance else {}),
+             **({'password': '********'} if 'password' in instance else {})}
+            for instance in config['artifactory_instances']
+        ]
+
     return redacted_config
\ No newline at end of file